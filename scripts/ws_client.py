@@ -60,6 +60,12 @@ async def send_message(action: str, params: Dict[str, Any] = None) -> None:
                 print(json.dumps(response_data, indent=2))
                 
                 if response_data.get("success"):
+                    data = response_data.get("data")
+                    if isinstance(data, dict) and data.get("binary"):
+                        # Binary responses (e.g. screenshots) arrive as an
+                        # announce frame followed by the raw payload frame
+                        payload = await websocket.recv()
+                        print(f"\n📦 Binary payload: {len(payload)} bytes ({data.get('mime', 'unknown')})")
                     print(f"\n✅ Action '{action}' completed successfully")
                 else:
                     error = response_data.get("error", {})
@@ -13,6 +13,14 @@ class Config(BaseModel):
     websocket_host: str = "localhost"
     websocket_port: int = 8765
     websocket_max_connections: int = 10
+    # Write-path coalescing: wait up to ws_flush_ms for more responses
+    # before flushing a frame (0 = flush immediately), capping batches
+    # at ws_max_batch messages
+    ws_flush_ms: int = 10
+    ws_max_batch: int = 128
+    # Bound on each connection's outbound queue; senders block (back-
+    # pressure) rather than buffering unboundedly for a slow client
+    ws_queue_max: int = 1024
     
     # WebSocket Client (New - connects to backend server)
     backend_server_url: str = "wss://your-backend-server.com/ws"
@@ -64,6 +72,9 @@ class Config(BaseModel):
             websocket_host=os.getenv("WEBSOCKET_HOST", "localhost"),
             websocket_port=int(os.getenv("WEBSOCKET_PORT", "8765")),
             websocket_max_connections=int(os.getenv("WEBSOCKET_MAX_CONNECTIONS", "10")),
+            ws_flush_ms=int(os.getenv("WS_FLUSH_MS", "10")),
+            ws_max_batch=int(os.getenv("WS_MAX_BATCH", "128")),
+            ws_queue_max=int(os.getenv("WS_QUEUE_MAX", "1024")),
             
             backend_server_url=os.getenv("BACKEND_SERVER_URL", "wss://your-backend-server.com/ws"),
             connection_retry_max=int(os.getenv("CONNECTION_RETRY_MAX", "5")),
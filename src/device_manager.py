@@ -17,10 +17,15 @@ class DeviceManager:
     def __init__(self):
         self.android_manager = AndroidDeviceManager()
         self.simctl_manager = SimctlManager()
-        
+
         # Track active robots for cleanup
         self.active_robots: Dict[str, Robot] = {}
 
+        # Bumped whenever the discovered device set changes; consumers use it
+        # to invalidate DeviceInfo.cached_dump results
+        self.version = 0
+        self._last_device_ids: frozenset = frozenset()
+
     async def list_all_devices(self) -> List[DeviceInfo]:
         """List all available devices from all platforms."""
         all_devices = []
@@ -33,7 +38,12 @@ class DeviceManager:
             # Get iOS simulators
             simulators = await self.simctl_manager.list_booted_simulators()
             all_devices.extend(simulators)
-            
+
+            device_ids = frozenset(device.id for device in all_devices)
+            if device_ids != self._last_device_ids:
+                self._last_device_ids = device_ids
+                self.version += 1
+
             logger.info(f"Found {len(all_devices)} total devices")
             return all_devices
             
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Dict, List, Optional, Union, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 
 
@@ -66,6 +66,22 @@ class DeviceInfo(BaseModel):
     is_emulator: bool = False
     status: str = "available"
 
+    # model_dump cache, invalidated via the device manager's version counter
+    _dump_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _dump_version: int = PrivateAttr(default=-1)
+
+    def cached_dump(self, version: int) -> Dict[str, Any]:
+        """Like model_dump(), but reuses the dict while version is unchanged.
+
+        Status updates re-serialize the same DeviceInfo instances on every
+        message; the pydantic field walk only needs to rerun when the device
+        list actually changed.
+        """
+        if self._dump_version != version:
+            self._dump_cache = self.model_dump()
+            self._dump_version = version
+        return self._dump_cache
+
 
 class InstalledApp(BaseModel):
     """Installed application information."""
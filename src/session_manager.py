@@ -1,5 +1,6 @@
 """Session management for S-Enricher backend server."""
 
+import threading
 import uuid
 import requests
 import time
@@ -224,32 +225,38 @@ class SessionManager:
 
 # Global session manager instance
 session_manager: Optional[SessionManager] = None
+_session_manager_lock = threading.Lock()
 
 
 def get_session_manager() -> SessionManager:
-    """Get or create the global session manager instance."""
+    """Get or create the global session manager instance (thread-safe)."""
     global session_manager
     if session_manager is None:
-        # Extract base URL from backend configuration
-        parsed_url = urlparse(config.backend_server_url)
-        if parsed_url.port == 8675:
-            # WebSocket port, convert to REST API port
-            base_url = f"http://{parsed_url.hostname}:8003"
-        else:
-            # Use the same host/port for REST API
-            scheme = 'https' if parsed_url.scheme == 'wss' else 'http'
-            port_part = f":{parsed_url.port}" if parsed_url.port else ""
-            base_url = f"{scheme}://{parsed_url.hostname}{port_part}"
-        
-        session_manager = SessionManager(base_url)
-        logger.info(f"Created global session manager for {base_url}")
-    
+        # Double-checked locking so concurrent first access (e.g. WebSocket
+        # and HTTP threads starting together) builds exactly one instance
+        with _session_manager_lock:
+            if session_manager is None:
+                # Extract base URL from backend configuration
+                parsed_url = urlparse(config.backend_server_url)
+                if parsed_url.port == 8675:
+                    # WebSocket port, convert to REST API port
+                    base_url = f"http://{parsed_url.hostname}:8003"
+                else:
+                    # Use the same host/port for REST API
+                    scheme = 'https' if parsed_url.scheme == 'wss' else 'http'
+                    port_part = f":{parsed_url.port}" if parsed_url.port else ""
+                    base_url = f"{scheme}://{parsed_url.hostname}{port_part}"
+
+                session_manager = SessionManager(base_url)
+                logger.info(f"Created global session manager for {base_url}")
+
     return session_manager
 
 
 def cleanup_session_manager():
     """Cleanup the global session manager."""
     global session_manager
-    if session_manager:
-        session_manager.delete_session()
-        session_manager = None
\ No newline at end of file
+    with _session_manager_lock:
+        if session_manager:
+            session_manager.delete_session()
+            session_manager = None
\ No newline at end of file
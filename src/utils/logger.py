@@ -1,14 +1,54 @@
 """Logging utilities for mobile automation service."""
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from config import config
 
 
+# Shared formatter - built once instead of per setup_logging call
+_formatter = logging.Formatter(config.log_format)
+
+# One queue/listener/rotating handler per log file, shared by every logger
+# that targets the same path. Independent rotating handlers on one file
+# rotate each other's renamed files and lose lines, and each would spin up
+# its own listener thread.
+_queue_handlers: Dict[str, logging.handlers.QueueHandler] = {}
+
+
+def _get_queue_handler(log_file_path: str) -> logging.handlers.QueueHandler:
+    handler = _queue_handlers.get(log_file_path)
+    if handler is None:
+        # Ensure log directory exists
+        Path(log_file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file_path, maxBytes=50_000_000, backupCount=3
+        )
+        file_handler.setLevel(getattr(logging, config.log_level))
+        file_handler.setFormatter(_formatter)
+
+        # Decouple producers from disk latency: log calls only enqueue,
+        # a background listener thread does the actual file writes
+        log_queue: queue.Queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+        handler = logging.handlers.QueueHandler(log_queue)
+        _queue_handlers[log_file_path] = handler
+    return handler
+
+
 def setup_logging(
     name: str = "mobile-automation", 
     log_level: Optional[str] = None,
@@ -24,49 +64,42 @@ def setup_logging(
     if logger.handlers:
         return logger
     
-    # Create formatter
-    formatter = logging.Formatter(config.log_format)
-    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_formatter)
     logger.addHandler(console_handler)
     
-    # File handler (if log file is specified)
+    # File handler (if log file is specified); the queue handler (and the
+    # rotating file handler behind it) is shared across loggers per path
     log_file_path = log_file or config.log_file_path
     if log_file_path:
-        # Ensure log directory exists
-        Path(log_file_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file_path)
-        file_handler.setLevel(getattr(logging, config.log_level))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+        logger.addHandler(_get_queue_handler(log_file_path))
+
     return logger
 
 
 def trace(message: str, logger: Optional[logging.Logger] = None) -> None:
     """Log a trace message."""
     if logger is None:
-        logger = get_logger()
+        logger = default_logger
     logger.debug(f"TRACE: {message}")
 
 
 def error(message: str, exception: Optional[Exception] = None, logger: Optional[logging.Logger] = None) -> None:
     """Log an error message with optional exception details."""
     if logger is None:
-        logger = get_logger()
-    
+        logger = default_logger
+
     if exception:
         logger.error(f"{message}: {str(exception)}", exc_info=True)
     else:
         logger.error(message)
 
 
+@functools.cache
 def get_logger(name: str = "mobile-automation") -> logging.Logger:
-    """Get or create a logger instance."""
+    """Get or create a logger instance (cached per name)."""
     return setup_logging(name)
 
 
@@ -1,18 +1,34 @@
 """WebSocket client for mobile automation service."""
 
 import asyncio
-import json
+import logging
 import uuid
 import random
 import time
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Literal, Optional, Callable
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import orjson
 import websockets
 from websockets.client import WebSocketClientProtocol
 from websockets.exceptions import ConnectionClosedError, WebSocketException
 
+try:
+    # pybase64 wraps libbase64, which dispatches to AVX2/NEON at runtime -
+    # roughly 3-5x faster than the stdlib's scalar loop on multi-MB buffers
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # uvloop's libuv-based event loop is 2-4x faster on socket I/O and task
+    # scheduling than the default selector loop; drop-in when available
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from config import config
 from utils.logger import get_logger
 from robot import ActionableError
@@ -22,6 +38,25 @@ from session_manager import get_session_manager, cleanup_session_manager
 
 logger = get_logger(__name__)
 
+# Shared serializer configuration: passing module-level references avoids
+# re-allocating the option int / default callable on every send
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+_ORJSON_DEFAULT = str
+
+# Timestamp string cache: [value, unix time it was computed]. Message
+# timestamps only need ~50 ms granularity, so burst responses reuse the
+# formatted string instead of allocating a datetime + isoformat each time.
+_ts_cache = ["", 0.0]
+
+
+def _now_iso() -> str:
+    """Return the current UTC timestamp as an ISO string (cached for 50 ms)."""
+    t = time.time()
+    if t - _ts_cache[1] > 0.05:
+        _ts_cache[0] = datetime.utcfromtimestamp(t).isoformat(timespec='milliseconds') + "Z"
+        _ts_cache[1] = t
+    return _ts_cache[0]
+
 
 @dataclass
 class RetryConfig:
@@ -31,8 +66,29 @@ class RetryConfig:
     max_delay: float = 60.0
     exponential_backoff: bool = True
     jitter: bool = True
+    # "full": capped exponential with full jitter, "decorrelated": AWS
+    # decorrelated jitter (grows from the previous delay), "exp": plain
+    # capped exponential without jitter
+    backoff_mode: Literal["full", "decorrelated", "exp"] = "full"
     health_check_interval: int = 30
     connection_timeout: int = 10
+    # Token bucket bounding total retry work (refilled at tokens_per_sec)
+    tokens_per_sec: float = 0.5
+    max_tokens: int = 5
+    # Keep-alive cadence vs dead-peer detection: a tight ping timeout keeps
+    # mean time-to-detect a dead tunnel at ~interval+timeout instead of ~30s
+    ping_interval: float = 10.0
+    ping_timeout: float = 3.0
+    close_timeout: float = 3.0
+    # Bucket state lives on the config - a fresh ConnectionManager is built
+    # for every reconnection cycle, so state kept there would reset to a
+    # full bucket each cycle and the cap would never bite
+    _tokens: float = field(init=False, repr=False, default=0.0)
+    _last_refill: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self):
+        self._tokens = float(self.max_tokens)
+        self._last_refill = time.monotonic()
 
 
 class ConnectionManager:
@@ -46,27 +102,45 @@ class ConnectionManager:
         self.last_heartbeat = None
         self.retry_count = 0
         self.health_check_task: Optional[asyncio.Task] = None
+        self._ping_fn: Optional[Callable] = None
+        self._send: Optional[Callable] = None
+        self._prev_delay = 0.0
+        self._out_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Replaced with loop.time on connect - a cached monotonic read that
+        # is cheaper than wall-clock time and immune to NTP slews
+        self._clock: Callable[[], float] = time.monotonic
         
     async def connect_with_retry(self) -> bool:
         """Connect to server with exponential backoff retry."""
         while self.retry_count < self.retry_config.max_retries:
             try:
+                await self._acquire_retry_token()
                 logger.info(f"Attempting to connect to {self.server_url} (attempt {self.retry_count + 1})")
                 
                 self.websocket = await asyncio.wait_for(
                     websockets.connect(
                         self.server_url,
                         max_size=None,
-                        ping_interval=20,
-                        ping_timeout=10,
-                        close_timeout=10
+                        ping_interval=self.retry_config.ping_interval,
+                        ping_timeout=self.retry_config.ping_timeout,
+                        close_timeout=self.retry_config.close_timeout
                     ),
                     timeout=self.retry_config.connection_timeout
                 )
                 
                 self.is_connected = True
                 self.retry_count = 0
-                self.last_heartbeat = time.time()
+                self._prev_delay = 0.0
+                self._clock = asyncio.get_running_loop().time
+                self.last_heartbeat = self._clock()
+                self._ping_fn = self.websocket.ping
+                self._send = self.websocket.send
+
+                # Single writer task drains the outbound queue so producers
+                # only pay for an enqueue instead of a coroutine suspension
+                self._out_queue = asyncio.Queue(maxsize=256)
+                self._writer_task = asyncio.create_task(self._writer_loop())
                 
                 # Health check is now handled in the message loop to avoid conflicts
                 # self.health_check_task = asyncio.create_task(self._health_check_loop())
@@ -88,43 +162,88 @@ class ConnectionManager:
         
         return False
     
+    async def _acquire_retry_token(self) -> None:
+        """Take a token from the retry bucket, sleeping until one refills.
+
+        Even jittered backoff restarts from scratch each time _message_loop
+        creates a fresh session; the bucket - stored on the RetryConfig the
+        client reuses across ConnectionManager recreations - caps overall
+        reconnection work when the server is hard-down.
+        """
+        cfg = self.retry_config
+        now = time.monotonic()
+        cfg._tokens = min(
+            cfg.max_tokens,
+            cfg._tokens + (now - cfg._last_refill) * cfg.tokens_per_sec
+        )
+        cfg._last_refill = now
+
+        if cfg._tokens < 1:
+            await asyncio.sleep((1 - cfg._tokens) / cfg.tokens_per_sec)
+            cfg._tokens = 1
+            cfg._last_refill = time.monotonic()
+
+        cfg._tokens -= 1
+
     def _calculate_delay(self) -> float:
         """Calculate delay for next retry attempt."""
+        if self.retry_config.backoff_mode == "decorrelated":
+            # Decorrelated jitter: sleep = min(cap, uniform(base, prev * 3)).
+            # Keeps expected backoff growth across attempts while fully
+            # randomizing, where full jitter can reset the trajectory
+            self._prev_delay = min(
+                self.retry_config.max_delay,
+                random.uniform(
+                    self.retry_config.base_delay,
+                    max(self.retry_config.base_delay, self._prev_delay * 3)
+                )
+            )
+            return self._prev_delay
+
         if not self.retry_config.exponential_backoff:
-            delay = self.retry_config.base_delay
+            capped = self.retry_config.base_delay
         else:
-            delay = min(
+            capped = min(
                 self.retry_config.base_delay * (2 ** (self.retry_count - 1)),
                 self.retry_config.max_delay
             )
-        
-        if self.retry_config.jitter:
-            # Add random jitter to prevent thundering herd
-            jitter = random.uniform(0, delay * 0.1)
-            delay += jitter
-            
-        return delay
+
+        if self.retry_config.jitter and self.retry_config.backoff_mode == "full":
+            # Full jitter (AWS backoff recommendation): a uniform draw over
+            # [0, capped] fully decorrelates clients after a mass disconnect,
+            # unlike a narrow additive jitter band around the same value
+            return random.uniform(0, capped)
+
+        return capped
     
     async def _health_check_loop(self):
-        """Periodic health check and reconnection."""
+        """Periodic health check via active ping probes."""
         while self.is_connected:
             try:
                 await asyncio.sleep(self.retry_config.health_check_interval)
-                
-                # Check if websocket is still connected
-                if self.websocket and not (hasattr(self.websocket, 'closed') and self.websocket.closed):
-                    try:
-                        # Send ping to check connection
-                        await self.websocket.ping()
-                        self.last_heartbeat = time.time()
-                        logger.debug("Health check passed")
-                    except Exception as ping_error:
-                        logger.warning(f"Ping failed: {ping_error}")
-                        await self._handle_connection_lost()
-                else:
+
+                if self._ping_fn is None:
                     logger.warning("WebSocket connection lost, attempting reconnection...")
                     await self._handle_connection_lost()
-                    
+                    continue
+
+                try:
+                    # Active probe: a pong within the timeout proves the tunnel
+                    # is alive - no need to introspect websocket state attributes
+                    pong_waiter = await asyncio.wait_for(
+                        self._ping_fn(),
+                        timeout=self.retry_config.connection_timeout
+                    )
+                    await asyncio.wait_for(
+                        pong_waiter,
+                        timeout=self.retry_config.connection_timeout
+                    )
+                    self.last_heartbeat = self._clock()
+                    logger.debug("Health check passed")
+                except (asyncio.TimeoutError, WebSocketException) as ping_error:
+                    logger.warning(f"Ping failed: {ping_error}")
+                    await self._handle_connection_lost()
+
             except Exception as e:
                 logger.error(f"Health check failed: {e}")
                 await self._handle_connection_lost()
@@ -132,31 +251,101 @@ class ConnectionManager:
     async def _handle_connection_lost(self):
         """Handle connection loss and attempt reconnection."""
         self.is_connected = False
+        self._ping_fn = None
+        self._send = None
+        if self._writer_task and self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+        self._writer_task = None
         if self.websocket:
             try:
                 await self.websocket.close()
             except:
                 pass
             self.websocket = None
-        
+
         # Reset retry count for reconnection
         self.retry_count = 0
         
         # Don't attempt immediate reconnection here - let the parent client handle it
         # This prevents infinite loops and allows for proper token refresh
     
+    async def _writer_loop(self):
+        """Drain the outbound queue onto the WebSocket.
+
+        A single writer lets websockets pipeline frames without a coroutine
+        suspension per send_message call.
+        """
+        try:
+            while self.is_connected:
+                payload = await self._out_queue.get()
+                try:
+                    if type(payload) is tuple:
+                        # Announce + binary payload queued as one item;
+                        # sending both here keeps the frames adjacent on
+                        # the wire regardless of queue pressure
+                        for part in payload:
+                            await self._send(part)
+                    else:
+                        await self._send(payload)
+                except Exception as e:
+                    logger.error(f"Failed to send message: {e}")
+                    await self._handle_connection_lost()
+                    return
+        except asyncio.CancelledError:
+            pass
+
     async def send_message(self, message: dict) -> bool:
-        """Send message to server."""
-        if not self.is_connected or not self.websocket:
+        """Queue a message for the writer task (returns without waiting)."""
+        if not self.is_connected or self._out_queue is None:
             logger.error("Not connected to server")
             return False
-        
+
         try:
-            await self.websocket.send(json.dumps(message, default=str))
+            # orjson is 2-10x faster than stdlib json and emits bytes directly;
+            # websockets transmits bytes frames without a utf-8 re-encode
+            self._out_queue.put_nowait(
+                orjson.dumps(message, default=_ORJSON_DEFAULT, option=_ORJSON_OPTS)
+            )
             return True
+        except asyncio.QueueFull:
+            # Back-pressure signal: the peer has stopped draining
+            logger.error("Outbound queue full, dropping message")
+            return False
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
-            await self._handle_connection_lost()
+            return False
+
+    async def send_raw(self, payload: bytes) -> bool:
+        """Queue a pre-serialized payload (sent as a binary frame)."""
+        if not self.is_connected or self._out_queue is None:
+            logger.error("Not connected to server")
+            return False
+
+        try:
+            self._out_queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            logger.error("Outbound queue full, dropping payload")
+            return False
+
+    async def send_with_binary(self, message: dict, payload: bytes) -> bool:
+        """Queue a JSON announce plus a binary frame as one inseparable item.
+
+        A single put means either both frames are queued or neither is, so
+        no other message can land between an announce and its payload.
+        """
+        if not self.is_connected or self._out_queue is None:
+            logger.error("Not connected to server")
+            return False
+
+        try:
+            self._out_queue.put_nowait((
+                orjson.dumps(message, default=_ORJSON_DEFAULT, option=_ORJSON_OPTS),
+                payload,
+            ))
+            return True
+        except asyncio.QueueFull:
+            logger.error("Outbound queue full, dropping announce and payload")
             return False
     
     async def receive_message(self) -> Optional[dict]:
@@ -166,7 +355,8 @@ class ConnectionManager:
         
         try:
             message = await self.websocket.recv()
-            return json.loads(message)
+            # orjson accepts both str and bytes frames
+            return orjson.loads(message)
         except ConnectionClosedError:
             logger.warning("Connection closed by server")
             await self._handle_connection_lost()
@@ -185,6 +375,14 @@ class ConnectionManager:
                 await self.health_check_task
             except asyncio.CancelledError:
                 pass
+
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
         
         if self.websocket:
             try:
@@ -210,7 +408,43 @@ class WebSocketMobileClient:
         self.selected_device: Optional[DeviceInfo] = None
         self.robot = None
         self.current_session = None
-        
+        self._message_task: Optional[asyncio.Task] = None
+        self._outer_retry_count = 0
+
+        # Short-TTL device list cache so back-to-back status requests
+        # collapse into a single device scan
+        self._devices_cache = (0.0, None)
+        self._devices_lock = asyncio.Lock()
+
+        # In-flight futures for idempotent read-only robot calls, keyed by
+        # (device id, operation, extra); concurrent identical requests share
+        # one device round-trip
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        # Messages are dispatched as their own tasks (bounded by the
+        # semaphore) so slow robot actions don't stall the stream and
+        # identical read-only requests overlap enough for _inflight to hit;
+        # the set keeps strong references until each task finishes
+        self._dispatch_sem = asyncio.Semaphore(8)
+        self._dispatch_tasks: set = set()
+
+        # Precomputed action -> bound handler table; avoids the f-string
+        # build plus hasattr/getattr MRO walk on every dispatched command
+        self._handlers: Dict[str, Callable] = {
+            name[len("_handle_"):]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_handle_")
+        }
+
+        # Typed-message dispatch table, checked before the farm-wrap shape
+        # probe so high-frequency traffic (pings, RPCs) takes one dict lookup
+        self._message_dispatch: Dict[str, Callable] = {
+            "automation_command": self._execute_automation_command,
+            "rpc_call": self._execute_rpc_command,
+            "ping": lambda message_id, message: self._handle_ping(message_id),
+            "status_request": lambda message_id, message: self._send_status_update(),
+        }
+
     async def start(self) -> bool:
         """Start the WebSocket client and connect to server."""
         logger.info(f"Starting WebSocket client with session management")
@@ -236,8 +470,11 @@ class WebSocketMobileClient:
                 logger.error("Failed to connect with authenticated WebSocket URL")
                 return False
             
-            # Start message handling loop
-            asyncio.create_task(self._message_loop())
+            # Start message handling loop; holding the task keeps it from
+            # being GC'd mid-run and lets stop() cancel it cleanly
+            self._message_task = asyncio.create_task(
+                self._message_loop(), name="ws-message-loop"
+            )
             
             # Auto-select default device for automation
             try:
@@ -301,50 +538,73 @@ class WebSocketMobileClient:
                     logger.warning("Connection lost, attempting reconnection with token refresh...")
                     success = await self._handle_reconnection()
                     if not success:
-                        logger.error("Reconnection failed, waiting before retry...")
-                        await asyncio.sleep(10)  # Wait 10 seconds before trying again
+                        # Jittered exponential backoff for the outer loop too -
+                        # a flat delay re-synchronizes the whole client fleet
+                        self._outer_retry_count += 1
+                        delay = min(
+                            self.retry_config.max_delay,
+                            self.retry_config.base_delay * (2 ** (self._outer_retry_count - 1))
+                        )
+                        logger.error(f"Reconnection failed, waiting up to {delay:.2f}s before retry...")
+                        await asyncio.sleep(random.uniform(0, delay))
                         continue
+                    self._outer_retry_count = 0
                 
                 message = await self.connection_manager.receive_message()
                 if message:
-                    await self._handle_server_message(message)
+                    # Acquire before spawning so a burst can't pile up
+                    # unbounded waiting tasks; _dispatch_message releases
+                    await self._dispatch_sem.acquire()
+                    task = asyncio.create_task(self._dispatch_message(message))
+                    self._dispatch_tasks.add(task)
+                    task.add_done_callback(self._dispatch_tasks.discard)
                 elif not self.connection_manager.is_connected:
                     # Connection was lost during receive
                     logger.warning("Connection lost during message receive")
                     continue
-                    
+
+            except asyncio.CancelledError:
+                # stop() cancelled the task - exit instead of reconnecting
+                break
             except Exception as e:
                 logger.error(f"Error in message loop: {e}")
                 await asyncio.sleep(1)
     
+    async def _dispatch_message(self, message: dict):
+        """Run one server message to completion, then free its dispatch slot."""
+        try:
+            await self._handle_server_message(message)
+        finally:
+            self._dispatch_sem.release()
+
     async def _handle_server_message(self, message: dict):
         """Handle incoming commands from server."""
         try:
             message_type = message.get("type")
             message_id = message.get("id")
-            
-            # Check if this is a farm-wrap RPC message (has 'action' and 'correlation_id')
+
+            # Known typed messages dispatch on the common path with a single
+            # dict lookup
+            handler = self._message_dispatch.get(message_type)
+            if handler is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Guarded: repr-ing the full message (which may embed
+                    # base64 payloads) is only worth it when DEBUG is on
+                    logger.debug("Received message type: %s, id: %s", message_type, message_id)
+                    logger.debug("Full message received: %s", message)
+                await handler(message_id, message)
+                return
+
+            # Fall through to the farm-wrap RPC shape (has 'action' and
+            # 'correlation_id') only when the type is unknown or missing
             if "action" in message and "correlation_id" in message:
                 logger.info(f"Received farm-wrap RPC message: {message['action']}")
                 await self._execute_farmwrap_rpc_command(message)
                 return
-            
-            # Enhanced debugging for other message types
-            logger.debug(f"Received message type: {message_type}, id: {message_id}")
-            logger.debug(f"Full message received: {message}")
-            
-            if message_type == "automation_command":
-                await self._execute_automation_command(message_id, message)
-            elif message_type == "rpc_call":  # Add RPC call handling
-                await self._execute_rpc_command(message_id, message)
-            elif message_type == "ping":
-                await self._handle_ping(message_id)
-            elif message_type == "status_request":
-                await self._send_status_update()
-            else:
-                logger.warning(f"Unknown message type: {message_type}")
-                logger.warning(f"Full message content: {message}")
-                logger.warning(f"Message keys: {list(message.keys()) if isinstance(message, dict) else 'Not a dict'}")
+
+            logger.warning(f"Unknown message type: {message_type}")
+            logger.warning(f"Full message content: {message}")
+            logger.warning(f"Message keys: {list(message.keys()) if isinstance(message, dict) else 'Not a dict'}")
                 
         except Exception as e:
             logger.error(f"Error handling server message: {e}")
@@ -357,11 +617,13 @@ class WebSocketMobileClient:
             params = command.get("params", {})
             
             logger.info(f"Executing command: {action}")
-            
-            # Route to appropriate handler
-            handler_name = f"_handle_{action}"
-            if hasattr(self, handler_name):
-                handler = getattr(self, handler_name)
+
+            # Route to appropriate handler; the command id rides along in
+            # params so handlers that emit extra frames (binary transport)
+            # can tag them for correlation
+            handler = self._handlers.get(action)
+            if handler is not None:
+                params["_request_id"] = command_id
                 result = await handler(params)
                 await self._send_success_response(command_id, result)
             else:
@@ -380,12 +642,12 @@ class WebSocketMobileClient:
             params = command.get("params", {})
             
             logger.info(f"Executing RPC command: {method}")
-            logger.debug(f"RPC params: {params}")
+            logger.debug("RPC params: %s", params)
             
             # Route to appropriate handler - same as automation commands
-            handler_name = f"_handle_{method}"
-            if hasattr(self, handler_name):
-                handler = getattr(self, handler_name)
+            handler = self._handlers.get(method)
+            if handler is not None:
+                params["_request_id"] = command_id
                 result = await handler(params)
                 await self._send_rpc_response(command_id, result)
             else:
@@ -406,15 +668,14 @@ class WebSocketMobileClient:
             execution_id = message.get("execution_id")
             
             logger.info(f"Executing farm-wrap RPC command: {action}")
-            logger.debug(f"RPC payload: {payload}")
+            logger.debug("RPC payload: %s", payload)
             
             # Convert payload to params (payload is usually a list with params as first item)
             params = payload[0] if payload else {}
             
             # Route to appropriate handler - same pattern as automation commands
-            handler_name = f"_handle_{action}"
-            if hasattr(self, handler_name):
-                handler = getattr(self, handler_name)
+            handler = self._handlers.get(action)
+            if handler is not None:
                 result = await handler(params)
                 logger.info(f"Successfully executed {action}, result: {result}")
                 await self._send_farmwrap_rpc_response(correlation_id, True, result)
@@ -435,86 +696,122 @@ class WebSocketMobileClient:
         """Handle ping from server."""
         await self._send_success_response(ping_id, {"status": "pong"})
     
+    # Response templates: copying a small dict is a single C call vs one
+    # PyDict_SetItem per key for a literal, and keeps the key sets in one place
+    _SUCCESS_TMPL = {"id": None, "type": "automation_result", "success": True, "data": None, "timestamp": None}
+    _ERROR_TMPL = {"id": None, "type": "automation_result", "success": False, "error": None, "timestamp": None}
+    _RPC_TMPL = {"id": None, "type": "rpc_response", "success": True, "result": None, "timestamp": None}
+    _RPC_ERROR_TMPL = {"id": None, "type": "rpc_response", "success": False, "error": None, "timestamp": None}
+    _FARMWRAP_TMPL = {"event": None, "correlation_id": None, "data": None, "timestamp": None}
+
     async def _send_success_response(self, request_id: str, data: Any):
         """Send success response to server."""
-        response = {
-            "id": request_id,
-            "type": "automation_result",
-            "success": True,
-            "data": data,
-            "timestamp": datetime.now().isoformat() + "Z"
-        }
+        response = self._SUCCESS_TMPL.copy()
+        response["id"] = request_id
+        response["data"] = data
+        response["timestamp"] = _now_iso()
         await self.connection_manager.send_message(response)
-    
+
     async def _send_error_response(self, request_id: str, message: str, code: str = "ERROR"):
         """Send error response to server."""
-        response = {
-            "id": request_id,
-            "type": "automation_result",
-            "success": False,
-            "error": {
-                "type": "ActionableError",
-                "message": message,
-                "code": code
-            },
-            "timestamp": datetime.now().isoformat() + "Z"
+        response = self._ERROR_TMPL.copy()
+        response["id"] = request_id
+        response["error"] = {
+            "type": "ActionableError",
+            "message": message,
+            "code": code
         }
+        response["timestamp"] = _now_iso()
         await self.connection_manager.send_message(response)
-    
+
     async def _send_rpc_response(self, request_id: str, data: Any):
         """Send RPC success response to S-Enricher."""
-        response = {
-            "id": request_id,
-            "type": "rpc_response",
-            "success": True,
-            "result": data,
-            "timestamp": datetime.now().isoformat() + "Z"
-        }
+        response = self._RPC_TMPL.copy()
+        response["id"] = request_id
+        response["result"] = data
+        response["timestamp"] = _now_iso()
         await self.connection_manager.send_message(response)
-        logger.debug(f"Sent RPC success response for {request_id}")
-    
+        logger.debug("Sent RPC success response for %s", request_id)
+
     async def _send_rpc_error_response(self, request_id: str, message: str):
         """Send RPC error response to S-Enricher."""
-        response = {
-            "id": request_id,
-            "type": "rpc_response", 
-            "success": False,
-            "error": message,
-            "timestamp": datetime.now().isoformat() + "Z"
-        }
+        response = self._RPC_ERROR_TMPL.copy()
+        response["id"] = request_id
+        response["error"] = message
+        response["timestamp"] = _now_iso()
         await self.connection_manager.send_message(response)
-        logger.debug(f"Sent RPC error response for {request_id}: {message}")
-    
+        logger.debug("Sent RPC error response for %s: %s", request_id, message)
+
     async def _send_farmwrap_rpc_response(self, correlation_id: str, success: bool, data: Any):
         """Send farm-wrap RPC response back to S-Enricher via WebSocket Gateway."""
         try:
             # Farm-wrap expects ClientEventPayload format with 'event' field
-            response = {
-                "event": "result" if success else "error",
-                "correlation_id": correlation_id,
-                "data": data,
-                "timestamp": datetime.now().isoformat() + "Z"
-            }
-            
+            response = self._FARMWRAP_TMPL.copy()
+            response["event"] = "result" if success else "error"
+            response["correlation_id"] = correlation_id
+            response["data"] = data
+            response["timestamp"] = _now_iso()
+
             await self.connection_manager.send_message(response)
             logger.info(f"Sent farm-wrap RPC response: success={success}, correlation_id={correlation_id}")
             
         except Exception as e:
             logger.error(f"Failed to send farm-wrap RPC response: {e}")
     
+    async def _dedupe(self, key: tuple, factory: Callable) -> Any:
+        """Share one in-flight robot call among concurrent identical requests.
+
+        The adb/WDA round-trip is the real bottleneck for read-only RPCs;
+        bursts of identical calls (element dumps while scrolling, repeated
+        screenshots) collapse onto a single device call.
+        """
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.ensure_future(factory())
+        self._inflight[key] = fut
+        try:
+            return await fut
+        finally:
+            self._inflight.pop(key, None)
+
+    def _device_key(self) -> Optional[str]:
+        return self.selected_device.id if self.selected_device else None
+
+    async def _cached_devices(self, ttl: float = 2.0):
+        """List all devices, reusing a recent scan within the TTL.
+
+        Device enumeration round-trips to adb/simctl; the lock makes
+        concurrent callers share one scan instead of each starting their own.
+        """
+        now = time.monotonic()
+        cached_at, devices = self._devices_cache
+        if devices is not None and now - cached_at <= ttl:
+            return devices
+
+        async with self._devices_lock:
+            now = time.monotonic()
+            cached_at, devices = self._devices_cache
+            if devices is None or now - cached_at > ttl:
+                devices = await self.device_manager.list_all_devices()
+                self._devices_cache = (time.monotonic(), devices)
+        return devices
+
     async def _send_status_update(self):
         """Send status update to server."""
         try:
-            devices = await self.device_manager.list_all_devices()
+            devices = await self._cached_devices()
+            version = self.device_manager.version
             status = {
                 "event": "ready",  # Use 'ready' event as expected by S-Enricher
                 "session_id": self.current_session.session_id if self.current_session else None,
                 "execution_id": None,  # No specific execution for status updates
                 "data": {
-                    "connected_devices": [device.model_dump() for device in devices],
-                    "selected_device": self.selected_device.model_dump() if self.selected_device else None,
+                    "connected_devices": [device.cached_dump(version) for device in devices],
+                    "selected_device": self.selected_device.cached_dump(version) if self.selected_device else None,
                     "service_status": "running",
-                    "timestamp": datetime.now().isoformat() + "Z"
+                    "timestamp": _now_iso()
                 }
             }
             await self.connection_manager.send_message(status)
@@ -525,8 +822,9 @@ class WebSocketMobileClient:
     # Device Management Handlers
     async def _handle_mobile_list_available_devices(self, params: dict) -> dict:
         """List all available devices."""
-        devices = await self.device_manager.list_all_devices()
-        return {"devices": [device.model_dump() for device in devices]}
+        devices = await self._cached_devices()
+        version = self.device_manager.version
+        return {"devices": [device.cached_dump(version) for device in devices]}
     
     async def _handle_mobile_use_default_device(self, params: dict) -> dict:
         """Auto-select single available device."""
@@ -568,9 +866,28 @@ class WebSocketMobileClient:
         if not self.robot:
             raise ActionableError("No device selected")
         
-        screenshot = await self.robot.get_screenshot()
-        import base64
-        screenshot_b64 = base64.b64encode(screenshot).decode('utf-8')
+        screenshot = await self._dedupe(
+            (self._device_key(), "get_screenshot"), self.robot.get_screenshot
+        )
+
+        if params.get("binary_transport"):
+            # Announce and PNG travel the outbound queue as one item, so no
+            # other frame can slip between them. Skips the base64 inflate
+            # and keeps only one copy of the payload in RAM.
+            queued = await self.connection_manager.send_with_binary(
+                {
+                    "id": params.get("_request_id"),
+                    "type": "automation_result",
+                    "binary_follows": True,
+                    "mime": "image/png"
+                },
+                screenshot,
+            )
+            if not queued:
+                raise ActionableError("Failed to queue screenshot for binary transport")
+            return {"format": "binary", "sent": True}
+
+        screenshot_b64 = base64.b64encode(screenshot).decode('ascii')
         return {"screenshot": screenshot_b64}
     
     async def _handle_swipe_on_screen(self, params: dict) -> dict:
@@ -621,7 +938,9 @@ class WebSocketMobileClient:
         if not self.robot:
             raise ActionableError("No device selected")
         
-        screen_size = await self.robot.get_screen_size()
+        screen_size = await self._dedupe(
+            (self._device_key(), "get_screen_size"), self.robot.get_screen_size
+        )
         return {"screen_size": screen_size.model_dump()}
     
     # App Management Handlers
@@ -655,7 +974,9 @@ class WebSocketMobileClient:
             raise ActionableError("No device selected")
         
         # Get screen elements from robot
-        elements = await self.robot.get_elements()
+        elements = await self._dedupe(
+            (self._device_key(), "get_elements"), self.robot.get_elements
+        )
         return {"elements": elements}
     
     async def _handle_mobile_list_apps(self, params: dict) -> dict:
@@ -664,7 +985,9 @@ class WebSocketMobileClient:
             raise ActionableError("No device selected")
         
         # Get installed apps from robot
-        apps = await self.robot.get_installed_apps()
+        apps = await self._dedupe(
+            (self._device_key(), "get_installed_apps"), self.robot.get_installed_apps
+        )
         return {"apps": apps}
     
     async def _handle_mobile_check_app_running(self, params: dict) -> dict:
@@ -677,7 +1000,10 @@ class WebSocketMobileClient:
             raise ActionableError("package_name parameter is required")
         
         # Check if app is running
-        is_running = await self.robot.is_app_running(package_name)
+        is_running = await self._dedupe(
+            (self._device_key(), "is_app_running", package_name),
+            lambda: self.robot.is_app_running(package_name)
+        )
         return {"is_running": is_running}
     
     async def _handle_mobile_get_running_apps(self, params: dict) -> dict:
@@ -686,13 +1012,32 @@ class WebSocketMobileClient:
             raise ActionableError("No device selected")
         
         # Get running apps from robot
-        running_apps = await self.robot.get_running_apps()
+        running_apps = await self._dedupe(
+            (self._device_key(), "get_running_apps"), self.robot.get_running_apps
+        )
         return {"apps": running_apps}
     
     async def stop(self):
         """Stop the WebSocket client."""
         logger.info("Stopping WebSocket client")
-        
+
+        # Stop the message loop first so it can't start a reconnect cycle
+        # against a client we're shutting down
+        if self._message_task:
+            self._message_task.cancel()
+            try:
+                await self._message_task
+            except asyncio.CancelledError:
+                pass
+            self._message_task = None
+
+        # Cancel any message handler tasks still running
+        for task in list(self._dispatch_tasks):
+            task.cancel()
+        if self._dispatch_tasks:
+            await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+        self._dispatch_tasks.clear()
+
         # Close WebSocket connection
         await self.connection_manager.close()
         
@@ -1,27 +1,160 @@
 """WebSocket server for mobile automation service."""
 
 import asyncio
+import base64
 import json
 import uuid
-from typing import Any, Callable, Dict, Optional
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
 
+import orjson
 import websockets
+from pydantic import TypeAdapter
 from websockets.server import WebSocketServerProtocol
 
 from src.config import config
 from src.utils.logger import get_logger
 from src.robot import ActionableError
-from src.types import WebSocketRequest, WebSocketResponse, ErrorInfo, DeviceInfo, DeviceType, SwipeDirection, Button, Orientation, LogOptions
+from src.types import WebSocketRequest, WebSocketResponse, ErrorInfo, DeviceInfo, DeviceType, SwipeDirection, Button, Orientation, LogOptions, ScreenElement, InstalledApp
 from src.device_manager import device_manager
 
 logger = get_logger(__name__)
 
+# Strong references to in-flight disconnect cleanups so the event loop
+# does not garbage-collect the tasks mid-run
+_pending_cleanups: set = set()
+
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+# Flush a drained batch early once its payload passes ~1 MiB
+_MAX_BATCH_BYTES = 1 << 20
+
+# Exact-type fallback encoders for values orjson does not handle natively.
+# One dict lookup replaces the blanket default=str, which also mangled
+# bytes into their repr
+_ENCODERS = {
+    uuid.UUID: str,
+    bytes: lambda b: base64.b64encode(b).decode(),
+    bytearray: lambda b: base64.b64encode(b).decode(),
+    set: list,
+    frozenset: list,
+}
+
+
+def _default(obj: Any) -> Any:
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+# Prebuilt validator: reuses pydantic's compiled core schema instead of
+# re-resolving fields through model __init__ on every message
+_REQ_ADAPTER = TypeAdapter(WebSocketRequest)
+
+# Batch serializers: one schema walk for a whole list instead of a
+# model_dump() call per element
+_ELEMENTS_ADAPTER = TypeAdapter(List[ScreenElement])
+_APPS_ADAPTER = TypeAdapter(List[InstalledApp])
+
+
+def _as_int(value: Any) -> int:
+    """Return JSON-decoded ints as-is; coerce only strings/floats."""
+    return value if type(value) is int else int(value)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a response with orjson (2-5x faster than stdlib json).
+
+    Returns bytes, which websockets transmits as a binary frame - clients
+    doing json.loads on the received payload are unaffected.
+    """
+    return orjson.dumps(obj, default=_default, option=_ORJSON_OPTS)
+
+
+class _PrecodedAck:
+    """Pre-serialized success envelope for handlers with a fixed payload.
+
+    The JSON is encoded once at import; _send_success only splices the
+    request id in, so ack-only actions never touch the encoder per call.
+    The static envelope omits the timestamp field, which is optional.
+    """
+
+    __slots__ = ("template",)
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.template = b'{"id":"__ID__","success":true,"data":' + orjson.dumps(payload) + b',"error":null}'
+
+    def render(self, id: str) -> bytes:
+        # orjson.dumps(id) yields the quoted, escaped JSON string
+        return self.template.replace(b'"__ID__"', orjson.dumps(id))
+
+
+_ACK_LAUNCHED = _PrecodedAck({"launched": True})
+_ACK_TERMINATED = _PrecodedAck({"terminated": True})
+_ACK_TAPPED = _PrecodedAck({"tapped": True})
+_ACK_LONG_PRESSED = _PrecodedAck({"longPressed": True})
+_ACK_TYPED = _PrecodedAck({"typed": True})
+
+
+class _ChunkedLogs:
+    """Large log payload streamed as several frames sharing one request id.
+
+    _send_success expands this into {"logs": ..., "done": false} chunks
+    followed by a final {"done": true}, so the client can start rendering
+    before the full payload has crossed the wire.
+    """
+
+    __slots__ = ("text",)
+
+    # Keep single-frame behavior below this size; stream above it
+    THRESHOLD = 256 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _BinaryPayload:
+    """Raw bytes routed through the outbound queue as their own binary frame.
+
+    _send_success attaches the serialized announce header so header and
+    payload travel the queue as one item - with concurrent dispatch, two
+    separate puts could let another handler's response land between them
+    and break the positional announce/frame pairing clients rely on.
+    """
+
+    __slots__ = ("mime", "data", "header")
+
+    def __init__(self, mime: str, data: bytes):
+        self.mime = mime
+        self.data = data
+        self.header: Optional[bytes] = None
+
 
 class SessionContext:
     """Per-connection session context for device selection and state."""
 
     def __init__(self):
         self.selected_device: Optional[DeviceInfo] = None
+        # Robot resolved for selected_device; cleared when the selection
+        # changes so _require_robot skips device_manager on repeat actions
+        self.robot = None
+        # Outbound responses; a per-connection drain task batches bursts
+        # into a single frame instead of one send() per response. The bound
+        # makes enqueueing block when a client stops reading, so handlers
+        # slow down instead of the queue pinning memory
+        self.out_queue: asyncio.Queue = asyncio.Queue(maxsize=config.ws_queue_max)
+        # Bounds how many actions one client can run concurrently
+        self.dispatch_sem = asyncio.Semaphore(8)
+        # Reusable assembly buffer for batched frames; grows to the size of
+        # the largest burst and is then recycled instead of reallocated
+        self.out_buf = bytearray()
+        # Set once the drain loop has exited; responses are dropped instead
+        # of queued so producers can never block on a queue nobody reads
+        self.closing = False
 
 
 class WebSocketMobileServer:
@@ -31,38 +164,189 @@ class WebSocketMobileServer:
         self.host = host
         self.port = port
         self.connections: Dict[WebSocketServerProtocol, SessionContext] = {}
+        # action -> bound handler, built once so dispatch is a dict lookup
+        # instead of string formatting plus hasattr/getattr per message
+        self._handlers: Dict[str, Callable] = {
+            name[len("handle_"):]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("handle_") and name != "handle_connection"
+        }
 
     async def start(self) -> None:
         """Start the WebSocket server."""
         logger.info(f"Starting WebSocket server at ws://{self.host}:{self.port}")
-        async with websockets.serve(self.handle_connection, self.host, self.port, max_size=None):
+        # compression=None turns off permessage-deflate: most payloads are
+        # small JSON or already-compressed PNGs, where deflate costs CPU and
+        # per-connection window memory for little wire savings
+        async with websockets.serve(self.handle_connection, self.host, self.port, compression=None, max_size=None):
             await asyncio.Future()  # Run forever
 
     async def handle_connection(self, websocket: WebSocketServerProtocol) -> None:
         """Handle a new client connection."""
         ctx = SessionContext()
         self.connections[websocket] = ctx
+        drain_task = asyncio.create_task(self._drain_loop(websocket, ctx))
         logger.info(f"Client connected: {websocket.remote_address}")
 
         try:
-            async for message in websocket:
-                await self.route_message(websocket, message)
+            # Dispatch each message as its own task so a slow robot action
+            # (screenshot, logs) does not stall the rest of the stream;
+            # responses carry the request id, so clients correlate replies
+            # that complete out of order
+            async with asyncio.TaskGroup() as tg:
+                async for message in websocket:
+                    tg.create_task(self.route_message(websocket, message))
         except websockets.exceptions.ConnectionClosedError as e:
             logger.info(f"Client disconnected with error: {e}")
         except Exception as e:
             logger.error(f"Connection error: {e}")
         finally:
-            # Cleanup on disconnection
+            # Cleanup on disconnection; robot teardown runs in the
+            # background so the disconnect path does not block reconnects
+            drain_task.cancel()
             if ctx.selected_device:
-                await device_manager.cleanup_robot(ctx.selected_device.id)
+                ctx.robot = None
+                task = asyncio.create_task(device_manager.cleanup_robot(ctx.selected_device.id))
+                _pending_cleanups.add(task)
+                task.add_done_callback(_pending_cleanups.discard)
             self.connections.pop(websocket, None)
             logger.info(f"Client disconnected: {websocket.remote_address}")
 
+    async def _drain_loop(self, websocket: WebSocketServerProtocol, ctx: SessionContext) -> None:
+        """Drain queued responses, coalescing bursts into one frame.
+
+        Blocks on the first response, then keeps a Nagle-style flush window
+        of config.ws_flush_ms open for more (capped at config.ws_max_batch).
+        With ws_flush_ms=0 only already-queued responses are coalesced, so
+        latency-critical deployments keep single-message behavior. A lone
+        response is sent exactly as before; a burst goes out as a JSON array
+        in a single frame.
+        """
+        flush_window = config.ws_flush_ms / 1000
+        max_batch = config.ws_max_batch
+        max_batch_bytes = _MAX_BATCH_BYTES
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                batch = [await ctx.out_queue.get()]
+
+                batch_bytes = self._approx_size(batch[0])
+
+                if flush_window:
+                    deadline = loop.time() + flush_window
+                    while len(batch) < max_batch and batch_bytes < max_batch_bytes:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(ctx.out_queue.get(), remaining)
+                        except asyncio.TimeoutError:
+                            break
+                        batch.append(item)
+                        batch_bytes += self._approx_size(item)
+                else:
+                    while len(batch) < max_batch and batch_bytes < max_batch_bytes:
+                        try:
+                            item = ctx.out_queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        batch.append(item)
+                        batch_bytes += self._approx_size(item)
+
+                await self._flush_batch(websocket, ctx, batch)
+        except asyncio.CancelledError:
+            pass
+        except websockets.exceptions.ConnectionClosed:
+            logger.debug("Connection closed while draining responses")
+        finally:
+            # Nothing drains after this point. Mark the context closed and
+            # empty the queue so handler tasks blocked in put() wake up;
+            # otherwise the TaskGroup in handle_connection waits on them
+            # forever and the connection never reaches its cleanup path.
+            ctx.closing = True
+            while True:
+                try:
+                    ctx.out_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+    @staticmethod
+    def _approx_size(item: Any) -> int:
+        """Payload size used to cap cumulative bytes per flush.
+
+        Exact for both item kinds: responses are serialized before they
+        are enqueued, so the queue only ever holds bytes or _BinaryPayload.
+        """
+        if isinstance(item, _BinaryPayload):
+            return len(item.data) + len(item.header or b"")
+        return len(item)
+
+    async def _flush_batch(self, websocket: WebSocketServerProtocol, ctx: SessionContext, batch: list) -> None:
+        """Send a drained batch, emitting _BinaryPayload items as raw frames."""
+        start = 0
+        for i, item in enumerate(batch):
+            if isinstance(item, _BinaryPayload):
+                if start < i:
+                    await self._send_chunk(websocket, ctx, batch[start:i])
+                if item.header is not None:
+                    await websocket.send(item.header)
+                await websocket.send(item.data)
+                start = i + 1
+        if start < len(batch):
+            await self._send_chunk(websocket, ctx, batch[start:])
+
+    @staticmethod
+    async def _send_chunk(websocket: WebSocketServerProtocol, ctx: SessionContext, chunk: list) -> None:
+        """Send one or more responses as a single websocket message.
+
+        Bursts are assembled as a JSON array into the connection's reusable
+        bytearray, so steady-state flushes allocate nothing beyond the final
+        bytes snapshot handed to send(); the receiver sees the same single
+        JSON array message as before.
+        """
+        if len(chunk) == 1:
+            await websocket.send(chunk[0])
+            return
+        buf = ctx.out_buf
+        buf.clear()
+        buf += b"["
+        for item in chunk:
+            buf += item
+            buf += b","
+        # Closing bracket replaces the trailing comma
+        buf[-1:] = b"]"
+        await websocket.send(bytes(buf))
+        if len(buf) > _MAX_BATCH_BYTES:
+            # Don't let one oversized burst (e.g. streamed log chunks) pin
+            # a megabyte-plus buffer on the connection for its lifetime
+            ctx.out_buf = bytearray()
+
     async def route_message(self, websocket: WebSocketServerProtocol, message: str) -> None:
         """Route incoming messages to appropriate handlers."""
         try:
-            data = json.loads(message)
-            request = WebSocketRequest(**data)
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            # orjson is the fast path but stricter than the stdlib parser
+            # (64-bit int range, no NaN/Infinity); retry with the full
+            # parser before rejecting a message it refused
+            try:
+                data = json.loads(message)
+            except Exception as e:
+                logger.error(f"Invalid message format: {e}")
+                await self._send_error(websocket, "invalid_request", "Invalid message format", code="INVALID_REQUEST")
+                return
+
+        # Reject unknown actions from the raw dict before paying for full
+        # pydantic validation of the request model
+        action = data.get("action") if isinstance(data, dict) else None
+        if action not in self._handlers:
+            req_id = data.get("id", "invalid_request") if isinstance(data, dict) else "invalid_request"
+            await self._send_error(websocket, req_id, f"Unknown action: {action}", code="UNKNOWN_ACTION")
+            return
+
+        try:
+            request = _REQ_ADAPTER.validate_python(data)
         except Exception as e:
             logger.error(f"Invalid message format: {e}")
             await self._send_error(websocket, "invalid_request", "Invalid message format", code="INVALID_REQUEST")
@@ -70,16 +354,16 @@ class WebSocketMobileServer:
 
         logger.debug(f"Received action: {request.action}")
         ctx = self.connections.get(websocket)
+        if ctx is None:
+            return
 
         try:
-            # Dispatch based on action
-            handler_name = f"handle_{request.action}"
-            if hasattr(self, handler_name):
-                handler = getattr(self, handler_name)
+            # Action was vetted against the table above; the semaphore caps
+            # per-connection parallelism now that dispatch is concurrent
+            handler = self._handlers[request.action]
+            async with ctx.dispatch_sem:
                 response_data = await handler(ctx, request.params)
-                await self._send_success(websocket, request.id, response_data)
-            else:
-                await self._send_error(websocket, request.id, f"Unknown action: {request.action}", code="UNKNOWN_ACTION")
+            await self._send_success(websocket, request.id, response_data)
 
         except ActionableError as ae:
             await self._send_error(websocket, request.id, str(ae), code=getattr(ae, 'code', 'ACTIONABLE_ERROR'), error_type="ActionableError")
@@ -88,13 +372,66 @@ class WebSocketMobileServer:
             await self._send_error(websocket, request.id, str(e), code="INTERNAL_ERROR", error_type="TechnicalError")
 
     async def _send_success(self, websocket: WebSocketServerProtocol, id: str, data: Any) -> None:
-        response = WebSocketResponse(id=id, success=True, data=data).model_dump()
-        await websocket.send(json.dumps(response, default=str))
+        if isinstance(data, _ChunkedLogs):
+            text = data.text
+            if len(text) <= _ChunkedLogs.THRESHOLD:
+                await self._enqueue_response(websocket, self._response(id, True, data={"logs": text}))
+                return
+            step = _ChunkedLogs.CHUNK_SIZE
+            for start in range(0, len(text), step):
+                chunk = {"logs": text[start:start + step], "done": False}
+                await self._enqueue_response(websocket, self._response(id, True, data=chunk))
+            await self._enqueue_response(websocket, self._response(id, True, data={"done": True}))
+            return
+        if isinstance(data, _PrecodedAck):
+            await self._enqueue_response(websocket, data.render(id))
+            return
+        if isinstance(data, _BinaryPayload):
+            # Attach the announce header and queue once; the drain loop
+            # sends the header frame immediately followed by the raw bytes
+            data.header = _dumps(self._response(id, True, data={"binary": True, "mime": data.mime}))
+            await self._enqueue_response(websocket, data)
+            return
+        await self._enqueue_response(websocket, self._response(id, True, data=data))
 
     async def _send_error(self, websocket: WebSocketServerProtocol, id: str, message: str, *, code: str, error_type: str = "TechnicalError") -> None:
-        error = ErrorInfo(type=error_type, message=message, code=code)
-        response = WebSocketResponse(id=id, success=False, error=error.model_dump()).model_dump()
-        await websocket.send(json.dumps(response, default=str))
+        error = {"type": error_type, "message": message, "code": code, "traceback": None}
+        await self._enqueue_response(websocket, self._response(id, False, error=error))
+
+    @staticmethod
+    def _response(id: str, success: bool, *, data: Any = None, error: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build a response dict with the WebSocketResponse wire shape.
+
+        Responses are our own output - running them back through pydantic
+        validation per message is pure overhead.
+        """
+        return {
+            "id": id,
+            "success": success,
+            "data": data,
+            "error": error,
+            "timestamp": datetime.now(),
+        }
+
+    async def _enqueue_response(self, websocket: WebSocketServerProtocol, response: Any) -> None:
+        # Serialize before queueing so the drain loop's byte accounting is
+        # exact; only _BinaryPayload items stay wrapped for raw-frame sends
+        if not isinstance(response, (bytes, _BinaryPayload)):
+            response = _dumps(response)
+        ctx = self.connections.get(websocket)
+        if ctx is None:
+            # Connection already removed - send directly as a last resort
+            if isinstance(response, _BinaryPayload):
+                if response.header is not None:
+                    await websocket.send(response.header)
+                await websocket.send(response.data)
+            else:
+                await websocket.send(response)
+            return
+        if ctx.closing:
+            # Drain loop is gone; the response is undeliverable
+            return
+        await ctx.out_queue.put(response)
 
     # Device Management Actions
     async def handle_mobile_list_available_devices(self, ctx: SessionContext, params: Dict[str, Any]) -> Any:
@@ -104,6 +441,7 @@ class WebSocketMobileServer:
     async def handle_mobile_use_default_device(self, ctx: SessionContext, params: Dict[str, Any]) -> Any:
         device = await device_manager.select_default_device()
         ctx.selected_device = device
+        ctx.robot = None
         return device.model_dump()
 
     async def handle_mobile_use_device(self, ctx: SessionContext, params: Dict[str, Any]) -> Any:
@@ -114,13 +452,24 @@ class WebSocketMobileServer:
         if not device:
             raise ActionableError(f"Device not found: {device_id}", code="DEVICE_NOT_FOUND")
         ctx.selected_device = device
+        ctx.robot = None
         return device.model_dump()
 
+    async def _ensure_robot(self, ctx: SessionContext):
+        """Slow path: resolve and cache the robot for the selected device."""
+        if not ctx.selected_device:
+            raise ActionableError("No device selected. Use mobile_use_default_device or mobile_use_device first.", code="NO_DEVICE_SELECTED")
+        ctx.robot = await device_manager.get_robot(ctx.selected_device)
+        return ctx.robot
+
     def _require_robot(func: Callable) -> Callable:
+        # The hot path is one attribute load and a truthiness check; the
+        # selected-device validation lives in _ensure_robot and only runs
+        # until the robot is cached on the context
         async def wrapper(self, ctx: SessionContext, params: Dict[str, Any]):
-            if not ctx.selected_device:
-                raise ActionableError("No device selected. Use mobile_use_default_device or mobile_use_device first.", code="NO_DEVICE_SELECTED")
-            robot = await device_manager.get_robot(ctx.selected_device)
+            robot = ctx.robot
+            if robot is None:
+                robot = await self._ensure_robot(ctx)
             return await func(self, robot, params)
         return wrapper
 
@@ -128,7 +477,7 @@ class WebSocketMobileServer:
     @_require_robot
     async def handle_mobile_list_apps(self, robot, params):
         apps = await robot.list_apps()
-        return [a.model_dump() for a in apps]
+        return _APPS_ADAPTER.dump_python(apps, mode="json")
 
     @_require_robot
     async def handle_mobile_launch_app(self, robot, params):
@@ -136,7 +485,7 @@ class WebSocketMobileServer:
         if not package_name:
             raise ActionableError("'packageName' (Android) or 'bundleId' (iOS) is required", code="MISSING_PACKAGE")
         await robot.launch_app(package_name)
-        return {"launched": True}
+        return _ACK_LAUNCHED
 
     @_require_robot
     async def handle_mobile_terminate_app(self, robot, params):
@@ -144,22 +493,22 @@ class WebSocketMobileServer:
         if not package_name:
             raise ActionableError("'packageName' (Android) or 'bundleId' (iOS) is required", code="MISSING_PACKAGE")
         await robot.terminate_app(package_name)
-        return {"terminated": True}
+        return _ACK_TERMINATED
 
     # Screen Interaction
     @_require_robot
     async def handle_mobile_click_on_screen_at_coordinates(self, robot, params):
-        x = int(params.get("x"))
-        y = int(params.get("y"))
+        x = _as_int(params.get("x"))
+        y = _as_int(params.get("y"))
         await robot.tap(x, y)
-        return {"tapped": True}
+        return _ACK_TAPPED
 
     @_require_robot
     async def handle_mobile_long_press_on_screen_at_coordinates(self, robot, params):
-        x = int(params.get("x"))
-        y = int(params.get("y"))
+        x = _as_int(params.get("x"))
+        y = _as_int(params.get("y"))
         await robot.long_press(x, y)
-        return {"longPressed": True}
+        return _ACK_LONG_PRESSED
 
     @_require_robot
     async def handle_swipe_on_screen(self, robot, params):
@@ -171,7 +520,7 @@ class WebSocketMobileServer:
     async def handle_mobile_type_keys(self, robot, params):
         text = params.get("text")
         await robot.send_keys(text)
-        return {"typed": True}
+        return _ACK_TYPED
 
     @_require_robot
     async def handle_mobile_press_button(self, robot, params):
@@ -189,14 +538,15 @@ class WebSocketMobileServer:
     @_require_robot
     async def handle_mobile_take_screenshot(self, robot, params):
         data = await robot.get_screenshot()
-        # Return as base64 to fit JSON transport
-        import base64
-        return {"image_base64": base64.b64encode(data).decode("ascii")}
+        # Ship the PNG as a raw binary frame (preceded by an announce
+        # message) instead of a base64 JSON field: ~25% less bandwidth and
+        # no encode cost. Clients read the announced frame as image bytes.
+        return _BinaryPayload("image/png", data)
 
     @_require_robot
     async def handle_mobile_list_elements_on_screen(self, robot, params):
         elements = await robot.get_elements_on_screen()
-        return [e.model_dump() for e in elements]
+        return _ELEMENTS_ADAPTER.dump_python(elements, mode="json")
 
     @_require_robot
     async def handle_mobile_get_screen_size(self, robot, params):
@@ -219,7 +569,7 @@ class WebSocketMobileServer:
     async def handle_mobile_get_logs(self, robot, params):
         options = LogOptions(**params) if params else None
         logs = await robot.get_device_logs(options)
-        return {"logs": logs}
+        return _ChunkedLogs(logs)
 
 
 async def main():
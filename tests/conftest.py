@@ -0,0 +1,25 @@
+"""Shared pytest fixtures for the test suite."""
+
+import sys
+from pathlib import Path
+
+# Add src to path once for the whole suite
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.device_manager import DeviceManager
+
+
+@pytest.fixture
+def device_manager():
+    """DeviceManager with platform managers mocked to return no devices.
+
+    Tests adjust return_value on the pre-wired mocks instead of building
+    fresh AsyncMocks per test.
+    """
+    dm = DeviceManager()
+    dm.android_manager.get_connected_devices = AsyncMock(return_value=[])
+    dm.simctl_manager.list_booted_simulators = AsyncMock(return_value=[])
+    return dm